@@ -124,19 +124,10 @@ class Visualizer:
             self.clock.tick(30)  # Maintain 30 FPS
 
     # FUSION VISUALIZATION
-    def show_fusion(self, mon1, mon2, result):
+    def show_fusion(self, parent1, parent2, result):
         # Use the actual monster images being fused
-        # Extract the actual elements from the result monster's name
-        result_parts = result["name"].split("_")
-        if len(result_parts) >= 2:
-            # For fused monsters, use the first element from the result
-            elem1 = result["elements"][0] if "elements" in result else "fire"
-            elem2 = result["elements"][1] if len(result["elements"]) > 1 else "water"
-        else:
-            elem1, elem2 = "fire", "water"
-        
-        m1_img = self.load_image(f"{elem1}_{mon1}")
-        m2_img = self.load_image(f"{elem2}_{mon2}")
+        m1_img = self.load_image(parent1)
+        m2_img = self.load_image(parent2)
         result_img = self.load_image(result["name"])
 
         # Phase 1
@@ -147,7 +138,7 @@ class Visualizer:
         self.screen.fill(self.bg_color)
         self.screen.blit(m1_img, (200, 200))
         self.screen.blit(m2_img, (680, 200))
-        txt = self.font.render(f"{elem1}_{mon1} + {elem2}_{mon2}", True, (255, 255, 255))
+        txt = self.font.render(f"{parent1} + {parent2}", True, (255, 255, 255))
         self.screen.blit(txt, (self.WIDTH//2 - txt.get_width()//2, 100))
         pygame.display.flip()
         
@@ -286,6 +277,32 @@ class Visualizer:
 
     # ENCYCLOPEDIA VISUALIZATION
     def show_pokedex(self, encyclopedia):
+        # Define all possible monsters (base + fusions)
+        base_combinations = []
+        for element in ["fire", "water", "grass"]:
+            for monster in ["cat", "dog", "rat"]:
+                base_combinations.append(f"{element}_{monster}")
+            
+        fusion_combinations = [
+            "vapor_tigron", "vapor_cerberus", "vapor_felhound", "vapor_scavlynx", "vapor_burrowfang", "vapor_gnawlord",
+            "blaze_tigron", "blaze_cerberus", "blaze_felhound", "blaze_scavlynx", "blaze_burrowfang", "blaze_gnawlord", 
+            "mud_tigron", "mud_cerberus", "mud_felhound", "mud_scavlynx", "mud_burrowfang", "mud_gnawlord",
+            "inferno_tigron", "inferno_cerberus", "inferno_felhound", "inferno_scavlynx", "inferno_burrowfang", "inferno_gnawlord",
+            "torrent_tigron", "torrent_cerberus", "torrent_felhound", "torrent_scavlynx", "torrent_burrowfang", "torrent_gnawlord",
+            "thorn_tigron", "thorn_cerberus", "thorn_felhound", "thorn_scavlynx", "thorn_burrowfang", "thorn_gnawlord"
+        ]
+            
+        all_monsters = base_combinations + fusion_combinations
+
+        # Scan the encyclopedia and load images once instead of every frame
+        discovered = {}
+        for key in encyclopedia.keys():
+            for monster_name in all_monsters:
+                if monster_name not in discovered and key.startswith(monster_name):
+                    discovered[monster_name] = key
+        slot_images = {monster_name: self.load_small_image(actual_name)
+                       for monster_name, actual_name in discovered.items()}
+
         start_time = time.time()
         while time.time() - start_time < 3.0:  # Show for 3 seconds
             self.handle_events()
@@ -298,23 +315,6 @@ class Visualizer:
             title = self.font.render("MONSTER DEX", True, (255, 255, 255))
             self.screen.blit(title, (self.WIDTH // 2 - title.get_width() // 2, 20))
             
-            # Define all possible monsters (base + fusions)
-            base_combinations = []
-            for element in ["fire", "water", "grass"]:
-                for monster in ["cat", "dog", "rat"]:
-                    base_combinations.append(f"{element}_{monster}")
-            
-            fusion_combinations = [
-                "vapor_tigron", "vapor_cerberus", "vapor_felhound", "vapor_scavlynx", "vapor_burrowfang", "vapor_gnawlord",
-                "blaze_tigron", "blaze_cerberus", "blaze_felhound", "blaze_scavlynx", "blaze_burrowfang", "blaze_gnawlord", 
-                "mud_tigron", "mud_cerberus", "mud_felhound", "mud_scavlynx", "mud_burrowfang", "mud_gnawlord",
-                "inferno_tigron", "inferno_cerberus", "inferno_felhound", "inferno_scavlynx", "inferno_burrowfang", "inferno_gnawlord",
-                "torrent_tigron", "torrent_cerberus", "torrent_felhound", "torrent_scavlynx", "torrent_burrowfang", "torrent_gnawlord",
-                "thorn_tigron", "thorn_cerberus", "thorn_felhound", "thorn_scavlynx", "thorn_burrowfang", "thorn_gnawlord"
-            ]
-            
-            all_monsters = base_combinations + fusion_combinations
-            
             # Display in a grid
             x_start, y_start = 40, 70
             slot_width = 120
@@ -337,27 +337,19 @@ class Visualizer:
                 pygame.draw.rect(self.screen, (100, 100, 120), slot_rect, 2)
                 
                 # Check if discovered
-                discovered = any(key.startswith(monster_name) for key in encyclopedia.keys())
+                actual_name = discovered.get(monster_name)
                 
-                if discovered:
-                    # Find the actual discovered monster name
-                    actual_name = None
-                    for key in encyclopedia.keys():
-                        if key.startswith(monster_name):
-                            actual_name = key
-                            break
-                    
-                    if actual_name:
-                        # Show actual image and name
-                        img = self.load_small_image(actual_name)
-                        self.screen.blit(img, (x + (slot_width - 10 - 80) // 2, y + 5))
+                if actual_name:
+                    # Show actual image and name
+                    img = slot_images[monster_name]
+                    self.screen.blit(img, (x + (slot_width - 10 - 80) // 2, y + 5))
                         
-                        # Display name (shortened if too long)
-                        display_name = actual_name
-                        if len(display_name) > 12:
-                            display_name = display_name[:10] + ".."
-                        name_text = self.tinyfont.render(display_name, True, (200, 255, 200))
-                        self.screen.blit(name_text, (x + (slot_width - 10) // 2 - name_text.get_width() // 2, y + 90))
+                    # Display name (shortened if too long)
+                    display_name = actual_name
+                    if len(display_name) > 12:
+                        display_name = display_name[:10] + ".."
+                    name_text = self.tinyfont.render(display_name, True, (200, 255, 200))
+                    self.screen.blit(name_text, (x + (slot_width - 10) // 2 - name_text.get_width() // 2, y + 90))
                 else:
                     # Show silhouette and ???
                     silhouette = pygame.Surface((80, 80))
@@ -372,14 +364,7 @@ class Visualizer:
                     name_text = self.tinyfont.render("???", True, (150, 150, 170))
                     self.screen.blit(name_text, (x + (slot_width - 10) // 2 - name_text.get_width() // 2, y + 90))
 
-            unique_discoveries = set()
-            for monster_name in all_monsters:
-                for key in encyclopedia.keys():
-                    if key.startswith(monster_name):
-                        unique_discoveries.add(monster_name)
-                        break
-            
-            discovered_count = len(unique_discoveries)
+            discovered_count = len(discovered)
             total_count = 36
             stats_text = self.smallfont.render(f"Discovered: {discovered_count}/{total_count}", True, (255, 255, 255))
             self.screen.blit(stats_text, (self.WIDTH // 2 - stats_text.get_width() // 2, self.HEIGHT - 40))
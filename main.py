@@ -1,4 +1,5 @@
-import random, math, os, json, pygame, sys, time
+import random, math, os, json, pygame, sys, time, itertools, heapq
+from functools import lru_cache
 from graphics import Visualizer  # import the external graphics file
 
 # FUNCTION TO CLEAR SCREEN
@@ -15,6 +16,14 @@ base_stats = {
     "rat": {"atk": 45, "def": 35, "spd": 70}
 }
 
+# FUSION AND BATTLE RULES
+HYBRID_ELEMENT = "hybrid"       # result of element pairs missing from element_results
+HYBRID_SPECIES = "chimera"      # result of species pairs missing from fusion_species
+STAT_MULTIPLIER = (0.75, 2.5)   # fused stat = parent average * uniform(min, max)
+MAX_STAT = 9999                 # fused stats are capped so deep self-fusion chains stay finite
+BATTLE_DAMAGE = (10, 30)        # damage per attack = randint(min, max)
+BATTLE_ROUNDS = 10
+
 # ELEMENT AND FUSION TABLES
 element_results = {
     frozenset(["fire", "water"]): "vapor",
@@ -43,6 +52,10 @@ def load_encyclopedia():
     if os.path.exists(SAVE_FILE):
         with open(SAVE_FILE, "r") as f:
             encyclopedia.update(json.load(f))
+    # Entries saved by older versions lack the precomputed view fields
+    for data in encyclopedia.values():
+        if "hp" not in data or "kind" not in data:
+            add_derived_fields(data)
     # Add base monsters to encyclopedia by default
     for element in elements:
         for monster in monsters:
@@ -51,20 +64,44 @@ def load_encyclopedia():
                 base_monster = {
                     "name": base_name,
                     "elements": [element],
+                    "element": element,
                     "species": monster,
                     "atk": base_stats[monster]["atk"],
                     "def": base_stats[monster]["def"],
                     "spd": base_stats[monster]["spd"],
                     "skills": [],
-                    "mutations": []
+                    "mutations": [],
+                    "parents": []
                 }
+                add_derived_fields(base_monster)
                 encyclopedia[base_name] = base_monster
+    rebuild_lineage()
     save_encyclopedia()
 
 def save_encyclopedia():
     with open(SAVE_FILE, "w") as f:
         json.dump(encyclopedia, f, indent=2)
 
+def add_derived_fields(monster):
+    """Precompute the fields `view en` needs so listing never recomputes them"""
+    monster["hp"] = (monster["atk"] + monster["def"]) // 2
+    # Base monsters carry a single element, fusions always record two
+    monster["kind"] = "base" if len(monster["elements"]) < 2 else "fused"
+
+def add_to_encyclopedia(monster):
+    add_derived_fields(monster)
+    encyclopedia[monster["name"]] = monster
+    for parent in monster.get("parents", []):
+        lineage_children.setdefault(parent, []).append(monster["name"])
+    record_fusion_name(monster)
+    # Cached descendant sets of the new monster's ancestors gain it in place,
+    # so adding a monster never forces a fresh walk
+    parents = monster.get("parents", [])
+    for owner, found in descendant_cache.items():
+        if any(parent == owner or parent in found for parent in parents):
+            found.add(monster["name"])
+    get_generation(monster["name"])  # parents are already cached, so this is O(1)
+
 def clear_encyclopedia():
     global encyclopedia
     encyclopedia.clear()
@@ -81,58 +118,170 @@ def get_monster_image(name):
     path = os.path.join(IMAGE_FOLDER, filename)
     return path if os.path.exists(path) else os.path.join(IMAGE_FOLDER, "default.png")
 
-# PARSE ELEMENT + MONSTER HELPER
-def parse_element_monster(text):
-    if "_" not in text:
-        return None, None, "Invalid format! Use element_monster (e.g., fire_cat)."
-    element, monster = text.split("_", 1)
-    if element not in elements:
-        return None, None, f"'{element}' is not a valid element."
-    if monster not in monsters:
-        return None, None, f"'{monster}' is not a valid monster."
-    return element, monster, None
+# LINEAGE
+# Each monster only stores its parents' names, so the encyclopedia is a DAG.
+# Children are indexed in memory and generations and lineage queries are
+# memoized; all walks are iterative so deep chains never hit the recursion limit.
+lineage_children = {}
+generation_cache = {}
+ancestor_cache = {}     # a monster's parents never change, so these never go stale
+descendant_cache = {}   # updated in place whenever a monster is added
+fusion_counts = {}      # element_species -> highest duplicate number in use
+LINEAGE_SHOWN = 10      # names listed per lineage query, the rest are counted
+
+def rebuild_lineage():
+    lineage_children.clear()
+    generation_cache.clear()
+    ancestor_cache.clear()
+    descendant_cache.clear()
+    fusion_counts.clear()
+    for name, data in encyclopedia.items():
+        for parent in data.get("parents", []):
+            lineage_children.setdefault(parent, []).append(name)
+        record_fusion_name(data)
+    # Parents are always resolved before their children, so this is one pass
+    for name in encyclopedia:
+        get_generation(name)
+
+def record_fusion_name(monster):
+    if len(monster["elements"]) < 2:
+        return
+    base_name = f"{get_element(monster)}_{monster['species']}"
+    name = monster["name"]
+    if name == base_name:
+        count = 1
+    elif name.startswith(base_name + "_") and name[len(base_name) + 1:].isdigit():
+        count = int(name[len(base_name) + 1:])
+    else:
+        return
+    fusion_counts[base_name] = max(fusion_counts.get(base_name, 0), count)
+
+def get_parents(name):
+    return [p for p in encyclopedia[name].get("parents", []) if p in encyclopedia]
+
+def get_generation(name):
+    """Base monsters are generation 0, each fusion is one more than its oldest parent"""
+    stack = [name]
+    while stack:
+        current = stack[-1]
+        if current in generation_cache:
+            stack.pop()
+            continue
+        parents = get_parents(current)
+        pending = [p for p in parents if p not in generation_cache]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        if parents:
+            generation_cache[current] = 1 + max(generation_cache[p] for p in parents)
+        else:
+            # Fusions saved before lineage was tracked have no parents recorded
+            generation_cache[current] = 0 if len(encyclopedia[current]["elements"]) < 2 else 1
+    return generation_cache[name]
+
+def get_ancestors(name):
+    """Every monster name fused into `name`, reusing any cached ancestor sets.
+
+    Only queried monsters are cached; caching every node on a deep chain would
+    store a set per generation and grow with depth squared.
+    """
+    if name in ancestor_cache:
+        return ancestor_cache[name]
+    seen = set()
+    stack = get_parents(name)
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        if current in ancestor_cache:
+            seen |= ancestor_cache[current]
+        else:
+            stack.extend(get_parents(current))
+    ancestor_cache[name] = frozenset(seen)
+    return ancestor_cache[name]
+
+def get_descendants(name):
+    if name in descendant_cache:
+        return descendant_cache[name]
+    seen = set()
+    stack = list(lineage_children.get(name, []))
+    while stack:
+        current = stack.pop()
+        if current in seen or current not in encyclopedia:
+            continue
+        seen.add(current)
+        if current in descendant_cache:
+            seen |= descendant_cache[current]
+        else:
+            stack.extend(lineage_children.get(current, []))
+    descendant_cache[name] = seen
+    return seen
+
+def format_lineage_names(names, nearest_first, limit=LINEAGE_SHOWN):
+    """Up to `limit` names closest in generation, then a count of the rest"""
+    if not names:
+        return "none"
+    sign = -1 if nearest_first == "latest" else 1
+    shown = heapq.nsmallest(limit, names, key=lambda n: (sign * get_generation(n), n))
+    text = ", ".join(shown)
+    if len(names) > limit:
+        text += f" +{len(names) - limit} more"
+    return text
+
+# PARSE FUSION PARENT HELPER
+def parse_fusion_parent(text):
+    monster = encyclopedia.get(text)
+    if not monster:
+        return None, f"Monster '{text}' not found in encyclopedia."
+    return monster, None
+
+def get_element(monster):
+    """Element a monster brings into a fusion (e.g. vapor for vapor_tigron)"""
+    if "element" in monster:
+        return monster["element"]
+    if len(monster["elements"]) == 1:
+        return monster["elements"][0]
+    e1, e2 = monster["elements"][0], monster["elements"][-1]
+    return element_results.get(frozenset([e1, e2]), f"{e1}_{e2}")
 
 # FUSION LOGIC
-def fuse_monsters(e1, m1, e2, m2):
+def fuse_monsters(parent1, parent2):
+    e1, m1 = get_element(parent1), parent1["species"]
+    e2, m2 = get_element(parent2), parent2["species"]
+    # Pairs outside the tables collapse to a fixed name instead of nesting the
+    # parents' names; the parents themselves are kept in "parents"
     fusion_elem_key = frozenset([e1, e2])
-    new_elem = element_results.get(fusion_elem_key, f"{e1}_{e2}")
+    new_elem = element_results.get(fusion_elem_key, e1 if e1 == e2 else HYBRID_ELEMENT)
     fusion_species_key = frozenset([m1, m2])
-    new_species = fusion_species.get(fusion_species_key, f"{m1}_{m2}")
+    new_species = fusion_species.get(fusion_species_key, m1 if m1 == m2 else HYBRID_SPECIES)
 
     def calculate_stat(stat_name):
-        base_avg = (base_stats[m1][stat_name] + base_stats[m2][stat_name]) / 2
-        multiplier = random.uniform(0.75, 2.5)
-        return int(base_avg * multiplier)
+        # Parents are capped too, so the product stays far from float overflow
+        base_avg = (min(parent1[stat_name], MAX_STAT) + min(parent2[stat_name], MAX_STAT)) / 2
+        multiplier = random.uniform(*STAT_MULTIPLIER)
+        return min(int(base_avg * multiplier), MAX_STAT)
 
     # Generate unique name for duplicate fusions
     base_name = f"{new_elem}_{new_species}"
-    fusion_count = 1
-    final_name = base_name
-
-    # Count how many times this fusion already exists
-    for existing_name in encyclopedia:
-        if existing_name.startswith(base_name):
-            if existing_name == base_name:
-                fusion_count = 2
-            elif existing_name.startswith(base_name + "_"):
-                try:
-                    count = int(existing_name.split("_")[-1])
-                    fusion_count = max(fusion_count, count + 1)
-                except ValueError:
-                    fusion_count += 1
-
-    if fusion_count > 1:
+    fusion_count = fusion_counts.get(base_name, 0) + 1
+    final_name = base_name if fusion_count == 1 else f"{base_name}_{fusion_count}"
+    while final_name in encyclopedia:
+        fusion_count += 1
         final_name = f"{base_name}_{fusion_count}"
 
     fused_monster = {
         "name": final_name,
         "elements": [e1, e2],
+        "element": new_elem,
         "species": new_species,
         "atk": calculate_stat("atk"),
         "def": calculate_stat("def"),
         "spd": calculate_stat("spd"),
         "skills": [],
-        "mutations": []
+        "mutations": [],
+        "parents": [parent1["name"], parent2["name"]]
     }
     return fused_monster, None
 
@@ -148,9 +297,9 @@ def simulate_battle(mon1_name, mon2_name):
     log = [f"=== BATTLE START ===", f"{mon1_name} vs {mon2_name}\n"]
 
     round_num = 1
-    while hp1 > 0 and hp2 > 0 and round_num <= 10:
-        dmg1 = random.randint(10, 30)
-        dmg2 = random.randint(10, 30)
+    while hp1 > 0 and hp2 > 0 and round_num <= BATTLE_ROUNDS:
+        dmg1 = random.randint(*BATTLE_DAMAGE)
+        dmg2 = random.randint(*BATTLE_DAMAGE)
 
         log.append(f"--- Round {round_num} ---")
 
@@ -185,6 +334,251 @@ def simulate_battle(mon1_name, mon2_name):
     log.append(f"\nWinner: {winner}")
     return "\n".join(log), winner
 
+# FUSION PLANNER
+# Everything here is computed exactly from the rules above instead of by
+# rolling fusions/battles, so planning stays instant as the tables grow.
+
+def stat_distribution(avg):
+    """Exact distribution {value: probability} of min(int(avg * uniform(min, max)), MAX_STAT)"""
+    lo, hi = avg * STAT_MULTIPLIER[0], avg * STAT_MULTIPLIER[1]
+    if hi <= lo:
+        return {min(int(lo), MAX_STAT): 1.0}
+    dist = {}
+    for n in range(int(lo), int(hi) + 1):
+        p = (min(n + 1, hi) - max(n, lo)) / (hi - lo)
+        if p > 0:
+            capped = min(n, MAX_STAT)
+            dist[capped] = dist.get(capped, 0.0) + p
+    return dist
+
+def stat_quantile(avg, q):
+    """q-quantile of int(avg * uniform(min, max)), the multiplier is monotonic"""
+    low, high = STAT_MULTIPLIER
+    return min(int(avg * (low + q * (high - low))), MAX_STAT)
+
+def _equal_runs(dist):
+    """Group consecutive values with the same probability into (first, last, p)"""
+    runs = []
+    for value in sorted(dist):
+        p = dist[value]
+        if runs and runs[-1][1] == value - 1 and runs[-1][2] == p:
+            runs[-1] = (runs[-1][0], value, p)
+        else:
+            runs.append((value, value, p))
+    return runs
+
+@lru_cache(maxsize=None)
+def _damage_tables():
+    """Distribution of total damage taken after k attacks, k = 0..BATTLE_ROUNDS.
+
+    Returns (pmfs, below) where below[k][h] = P(total damage after k attacks < h).
+    """
+    low, high = BATTLE_DAMAGE
+    per_hit = 1.0 / (high - low + 1)
+    size = high * BATTLE_ROUNDS + 2
+    pmfs = [[0.0] * size]
+    pmfs[0][0] = 1.0
+    for _ in range(BATTLE_ROUNDS):
+        prev, cur = pmfs[-1], [0.0] * size
+        for total, p in enumerate(prev):
+            if p:
+                for dmg in range(low, high + 1):
+                    cur[total + dmg] += p * per_hit
+        pmfs.append(cur)
+
+    below = []
+    for pmf in pmfs:
+        running, row = 0.0, []
+        for p in pmf:
+            row.append(running)
+            running += p
+        row.append(running)
+        below.append(row)
+    return pmfs, below
+
+def _prob_below(row, h):
+    if h <= 0:
+        return 0.0
+    return row[min(h, len(row) - 1)]
+
+@lru_cache(maxsize=None)
+def win_probability(hp1, hp2):
+    """Exact chance that the first attacker wins simulate_battle from hp1 vs hp2.
+
+    Both damage streams are independent, so each side is described by the round
+    in which its total damage taken first reaches its HP. The first attacker wins
+    if the opponent falls no later than it does, otherwise remaining HP decides.
+    """
+    if hp1 <= 0 or hp2 <= 0:
+        return 1.0 if hp1 > hp2 else 0.0 if hp2 > hp1 else 0.5
+    pmfs, below = _damage_tables()
+
+    win = 0.0
+    for k in range(1, BATTLE_ROUNDS + 1):
+        opponent_falls = _prob_below(below[k - 1], hp2) - _prob_below(below[k], hp2)
+        still_standing = _prob_below(below[k - 1], hp1)
+        win += opponent_falls * still_standing
+
+    # Both survive every round: compare remaining HP, draws are a coin flip
+    last_pmf, last_below = pmfs[BATTLE_ROUNDS], below[BATTLE_ROUNDS]
+    for taken, p in enumerate(last_pmf[:hp1]):
+        if not p:
+            continue
+        left = hp1 - taken
+        win += p * (_prob_below(last_below, hp2) - _prob_below(last_below, hp2 - left + 1))
+        if 0 <= hp2 - left < len(last_pmf):
+            win += p * 0.5 * last_pmf[hp2 - left]
+    return win
+
+def expected_win(atk_dist, def_dist, opponent_hp):
+    """Exact chance a fusion with these ATK/DEF distributions wins against opponent_hp.
+
+    Every value of int(avg * uniform) except the two ends is equally likely, so
+    DEF collapses into a few runs and each run is one prefix-sum lookup over
+    win chances by ATK + DEF, instead of a loop over every DEF value.
+    """
+    runs = _equal_runs(def_dist)
+    low = min(atk_dist) + runs[0][0]
+    high = max(atk_dist) + runs[-1][1]
+    prefix = [0.0]
+    for total in range(low, high + 1):
+        prefix.append(prefix[-1] + win_probability(total // 2, opponent_hp))
+
+    win = 0.0
+    for atk, p_atk in atk_dist.items():
+        for first, last, p in runs:
+            win += p_atk * p * (prefix[atk + last - low + 1] - prefix[atk + first - low])
+    return win
+
+def plan_fusions(top_k=5, opponent=None):
+    """Rank the species pairs in fusion_species and list their element variants.
+
+    Stats only depend on the species pair, so pairs are ranked first and only
+    the top_k winners are expanded over element_results. Ranking is by win
+    chance against `opponent` (fused monster attacks first) when one is given,
+    otherwise by expected ATK + DEF + SPD.
+    """
+    opponent_hp = None
+    if opponent is not None:
+        opp = encyclopedia[opponent]
+        opponent_hp = (opp["atk"] + opp["def"]) // 2
+
+    species_plans = []
+    for species_key, new_species in fusion_species.items():
+        pair = sorted(species_key)
+        m1, m2 = pair[0], pair[-1]
+        stats = {}
+        for stat_name in ("atk", "def", "spd"):
+            avg = (base_stats[m1][stat_name] + base_stats[m2][stat_name]) / 2
+            dist = stat_distribution(avg)
+            stats[stat_name] = {
+                "dist": dist,
+                "mean": sum(v * p for v, p in dist.items()),
+                "p10": stat_quantile(avg, 0.1),
+                "p90": stat_quantile(avg, 0.9),
+            }
+        win = None
+        if opponent_hp is not None:
+            win = expected_win(stats["atk"]["dist"], stats["def"]["dist"], opponent_hp)
+        species_plans.append({
+            "species": new_species,
+            "pair": (m1, m2),
+            "stats": stats,
+            "win": win,
+            "expected_total": sum(stats[s]["mean"] for s in ("atk", "def", "spd")),
+        })
+
+    # Rounded so float noise in the summed means can't break ties, which then
+    # fall back to the species name
+    if opponent_hp is not None:
+        best = heapq.nsmallest(top_k, species_plans, key=lambda r: (
+            -round(r["win"], 6), -round(r["expected_total"], 6), r["species"]))
+    else:
+        best = heapq.nsmallest(top_k, species_plans, key=lambda r: (
+            -round(r["expected_total"], 6), r["species"]))
+
+    for plan in best:
+        m1, m2 = plan["pair"]
+        plan["variants"] = []
+        for element_key, new_elem in element_results.items():
+            pair = sorted(element_key)
+            e1, e2 = pair[0], pair[-1]
+            plan["variants"].append((f"{new_elem}_{plan['species']}", f"{e1}_{m1} + {e2}_{m2}"))
+        plan["variants"].sort()
+    return best
+
+def format_plan(recipes, opponent=None, shown_variants=2):
+    lines = []
+    for rank, r in enumerate(recipes, 1):
+        variants = ", ".join(f"{name} ({recipe})" for name, recipe in r["variants"][:shown_variants])
+        line = f"{rank}. {r['species']} as {variants}"
+        if len(r["variants"]) > shown_variants:
+            line += f" +{len(r['variants']) - shown_variants} more"
+        for stat_name in ("atk", "def", "spd"):
+            s = r["stats"][stat_name]
+            line += f" | {stat_name.upper()} {s['mean']:.1f} [{s['p10']}-{s['p90']}]"
+        if r["win"] is not None:
+            line += f" | WIN {r['win'] * 100:.1f}% vs {opponent}"
+        lines.append(line)
+    return "\n".join(lines)
+
+# ENCYCLOPEDIA VIEW
+VIEW_SECTIONS = {"base": "=== BASE MONSTERS ===", "fused": "=== FUSED MONSTERS ==="}
+VIEW_SORT_KEYS = ("name", "hp", "atk", "def", "spd")
+VIEW_PAGE_SIZE = 20
+
+def iter_encyclopedia_view(page=1, limit=None, sort=None, name_filter=None):
+    """Lazily yield `view en` lines, base monsters first, then fused monsters.
+
+    name_filter is either a kind ("base"/"fused") or text the name must contain.
+    Stats sort highest first, names sort alphabetically.
+    """
+    kinds = list(VIEW_SECTIONS)
+    if name_filter in VIEW_SECTIONS:
+        kinds, name_filter = [name_filter], None
+
+    def section(kind):
+        entries = (data for data in encyclopedia.values()
+                   if data["kind"] == kind and (not name_filter or name_filter in data["name"]))
+        if sort == "name":
+            return iter(sorted(entries, key=lambda d: d["name"]))
+        if sort:
+            return iter(sorted(entries, key=lambda d: (-d[sort], d["name"])))
+        return entries
+
+    entries = (data for kind in kinds for data in section(kind))
+    start = (page - 1) * limit if limit else 0
+    stop = start + limit if limit else None
+
+    current_kind = None
+    for data in itertools.islice(entries, start, stop):
+        if data["kind"] != current_kind:
+            current_kind = data["kind"]
+            yield VIEW_SECTIONS[current_kind]
+        yield f"{data['name']} | HP {data['hp']} ATK {data['atk']} DEF {data['def']} SPD {data['spd']}"
+
+def parse_view_args(tokens):
+    """Parse `page N`, `limit N`, `sort KEY` and `filter TEXT` pairs"""
+    options = {"page": 1, "limit": None, "sort": None, "name_filter": None}
+    if len(tokens) % 2:
+        return None, "Usage: view en [page N] [limit N] [sort name|hp|atk|def|spd] [filter base|fused|text]"
+    for option, value in zip(tokens[::2], tokens[1::2]):
+        if option in ("page", "limit"):
+            if not value.isdigit() or int(value) < 1:
+                return None, f"'{option}' must be a positive number."
+            options[option] = int(value)
+        elif option == "sort":
+            if value not in VIEW_SORT_KEYS:
+                return None, f"'{value}' is not a valid sort key ({', '.join(VIEW_SORT_KEYS)})."
+            options["sort"] = value
+        elif option == "filter":
+            options["name_filter"] = value
+        else:
+            return None, f"Unknown view option '{option}'."
+    if options["page"] > 1 and options["limit"] is None:
+        options["limit"] = VIEW_PAGE_SIZE
+    return options, None
+
 # VISUALIZER INTEGRATION
 visualizer = Visualizer()  # create one visualizer for the session
 
@@ -202,10 +596,13 @@ def safe_execute(command, context):
             # help
             if tokens[0] == "help":
                 result += """Available commands:
-fuse [element_monster] + [element_monster]
+fuse [monster1] + [monster2]
 battle [monster1] [monster2]
+lineage [monster]
+best [opponent] [count]  (alias: plan)
 summon [monster_name]
-view en / clear en / exit
+view en [page N] [limit N] [sort name|hp|atk|def|spd] [filter base|fused|text]
+clear en / exit
 """
                 continue
 
@@ -214,28 +611,20 @@ view en / clear en / exit
                 if not encyclopedia:
                     result += "Encyclopedia is empty.\n"
                 else:
-                    # Separate base monsters from fused monsters
-                    base_monsters = []
-                    fused_monsters = []
-
-                    for name, data in encyclopedia.items():
-                        hp = (data['atk'] + data['def']) // 2
-                        entry = f"{name} | HP {hp} ATK {data['atk']} DEF {data['def']} SPD {data['spd']}"
-
-                        # Check if it's a base monster (element_base format)
-                        parts = name.split('_')
-                        if len(parts) == 2 and parts[0] in elements and parts[1] in monsters:
-                            base_monsters.append(entry)
-                        else:
-                            fused_monsters.append(entry)
-
-                    if base_monsters:
-                        result += "=== BASE MONSTERS ===\n"
-                        result += "\n".join(base_monsters) + "\n"
-
-                    if fused_monsters:
-                        result += "=== FUSED MONSTERS ===\n"
-                        result += "\n".join(fused_monsters) + "\n"
+                    options, err = parse_view_args(tokens[2:])
+                    if err:
+                        result += err + "\n"
+                        continue
+                    # Print earlier output first, then stream entries straight to the terminal
+                    if result:
+                        print(result.strip())
+                        result = ""
+                    shown = 0
+                    for line in iter_encyclopedia_view(**options):
+                        print(line)
+                        shown += 1
+                    if not shown:
+                        result += "No monsters match.\n"
 
                 # Show visual Pokedex
                 visualizer.show_pokedex(encyclopedia)
@@ -250,17 +639,17 @@ view en / clear en / exit
             # fuse
             if tokens[0] == "fuse" and "+" in tokens:
                 idx = tokens.index("+")
-                e1, m1, err1 = parse_element_monster(tokens[1])
-                e2, m2, err2 = parse_element_monster(tokens[idx + 1])
+                parent1, err1 = parse_fusion_parent(tokens[1])
+                parent2, err2 = parse_fusion_parent(tokens[idx + 1])
                 if err1 or err2:
                     result += (err1 or err2) + "\n"
                     continue
-                fused, _ = fuse_monsters(e1, m1, e2, m2)
-                encyclopedia[fused['name']] = fused
+                fused, _ = fuse_monsters(parent1, parent2)
+                add_to_encyclopedia(fused)
                 save_encyclopedia()
 
                 # visualize automatically
-                visualizer.show_fusion(m1, m2, fused)
+                visualizer.show_fusion(parent1["name"], parent2["name"], fused)
 
                 result += f"Fusion successful: {fused['name']}\n"
                 context = fused
@@ -277,6 +666,41 @@ view en / clear en / exit
                 result += battle_log + "\n"
                 continue
 
+            # lineage
+            if tokens[0] == "lineage" and len(tokens) >= 2:
+                name = tokens[1]
+                if name not in encyclopedia:
+                    result += f"Monster '{name}' not found in encyclopedia.\n"
+                    continue
+                parents = get_parents(name)
+                ancestors = get_ancestors(name)
+                descendants = get_descendants(name)
+                result += f"{name} | Generation {get_generation(name)}\n"
+                result += f"Parents: {' + '.join(parents) if parents else 'none'}\n"
+                result += f"Ancestors ({len(ancestors)}): {format_lineage_names(ancestors, 'latest')}\n"
+                result += f"Descendants ({len(descendants)}): {format_lineage_names(descendants, 'earliest')}\n"
+                continue
+
+            # best fusion recipes
+            if tokens[0] in ("best", "plan"):
+                counts = [tok for tok in tokens[1:] if tok.isdigit()]
+                opponents = [tok for tok in tokens[1:] if not tok.isdigit()]
+                if len(counts) > 1 or len(opponents) > 1:
+                    result += "Usage: best [opponent] [count]\n"
+                    continue
+                top_k = int(counts[0]) if counts else 5
+                opponent = opponents[0] if opponents else None
+                if top_k < 1:
+                    result += "'count' must be a positive number.\n"
+                    continue
+                if opponent is not None and opponent not in encyclopedia:
+                    result += f"Monster '{opponent}' not found in encyclopedia.\n"
+                    continue
+                plans = plan_fusions(top_k, opponent)
+                header = f"=== BEST {len(plans)} FUSIONS" + (f" VS {opponent} ===" if opponent else " ===")
+                result += header + "\n" + format_plan(plans, opponent) + "\n"
+                continue
+
             # summon
             if tokens[0] == "summon" and len(tokens) >= 2:
                 name = tokens[1]